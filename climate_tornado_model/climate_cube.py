@@ -0,0 +1,143 @@
+import os
+import numpy as np
+import pandas as pd
+
+from collections import namedtuple
+
+ClimateCube = namedtuple('ClimateCube',['values','mask','present','years','stations','coords','features'])
+
+def build_climate_cube(data,features:list,path,year_feature='DATE',station_feature='NAME',lat_feature='LATITUDE',lon_feature='LONGITUDE'):
+    '''
+        Pivots the long climate dataframe data (one row per station and year, as in yearly_climate_data.csv) once into a dense cube,
+        which is written to the directory path as .npy files and returned opened read-only as a ClimateCube.
+
+        A station is a distinct (station_feature, lat_feature, lon_feature) triple, so that every row keeps its exact coordinates.
+        The stored arrays are
+            values - float32 array of shape (years, stations, features), NaN wherever a value is missing
+            mask - boolean array of the same shape, True wherever a value is present
+            present - boolean array of shape (years, stations), True wherever data has a row for that station and year, even if all its features are NaN
+            years - sorted integer array of the years, indexing the first axis
+            stations - string array of the station names, indexing the second axis
+            coords - float array of shape (stations,2), with each row consisting of a (latitude,longitude) pair
+            features - string array of the feature names, indexing the third axis
+        values, mask and present are filled through memory maps, so the dense cube is never held in memory at once.
+
+        Raises a ValueError if data has a row with a missing latitude or longitude, or more than one row for the same station and year,
+        since these cannot be stored in the cube. Both are checked before anything is written to disk.
+    '''
+    if data[[lat_feature,lon_feature]].isna().any().any():
+        raise ValueError('data contains rows with a missing ' + lat_feature + ' or ' + lon_feature)
+
+    years, year_idx = np.unique(data[year_feature].to_numpy(dtype=int),return_inverse=True)
+    station_keys = data[[station_feature,lat_feature,lon_feature]].astype({station_feature:str})
+    station_idx = station_keys.groupby([station_feature,lat_feature,lon_feature],sort=False).ngroup().to_numpy()
+    station_df = station_keys.drop_duplicates()
+
+    if pd.Series(list(zip(year_idx,station_idx))).duplicated().any():
+        raise ValueError('data contains more than one row for the same ' + year_feature + ', ' + station_feature + ', ' + lat_feature + ' and ' + lon_feature)
+
+    os.makedirs(path,exist_ok=True)
+
+    shape = (len(years),len(station_df),len(features))
+    values = np.lib.format.open_memmap(os.path.join(path,'values.npy'),mode='w+',dtype=np.float32,shape=shape)
+    mask = np.lib.format.open_memmap(os.path.join(path,'mask.npy'),mode='w+',dtype=bool,shape=shape)
+    present = np.lib.format.open_memmap(os.path.join(path,'present.npy'),mode='w+',dtype=bool,shape=shape[:2])
+
+    for i in range(len(years)):
+        values[i] = np.nan
+        mask[i] = False
+        present[i] = False
+
+    feature_values = data[features].to_numpy(dtype=np.float32)
+    values[year_idx,station_idx] = feature_values
+    mask[year_idx,station_idx] = ~np.isnan(feature_values)
+    present[year_idx,station_idx] = True
+
+    values.flush()
+    mask.flush()
+    present.flush()
+    del values, mask, present
+
+    np.save(os.path.join(path,'years.npy'),years)
+    np.save(os.path.join(path,'stations.npy'),station_df[station_feature].to_numpy(dtype=str))
+    np.save(os.path.join(path,'coords.npy'),station_df[[lat_feature,lon_feature]].to_numpy(dtype=float))
+    np.save(os.path.join(path,'features.npy'),np.array(features,dtype=str))
+
+    return load_climate_cube(path)
+
+def load_climate_cube(path):
+    '''
+        Opens the cube written by build_climate_cube in the directory path. values, mask and present are memory-mapped read-only,
+        so any number of worker processes may each call this on the same path and share the cube through the page cache without copying it.
+    '''
+    return ClimateCube(
+        values = np.load(os.path.join(path,'values.npy'),mmap_mode='r'),
+        mask = np.load(os.path.join(path,'mask.npy'),mmap_mode='r'),
+        present = np.load(os.path.join(path,'present.npy'),mmap_mode='r'),
+        years = np.load(os.path.join(path,'years.npy')),
+        stations = np.load(os.path.join(path,'stations.npy')),
+        coords = np.load(os.path.join(path,'coords.npy')),
+        features = np.load(os.path.join(path,'features.npy')))
+
+def year_index(cube,year):
+    '''
+        Outputs the position of year along the first axis of the cube.
+    '''
+    i = np.searchsorted(cube.years,year)
+    if i == len(cube.years) or cube.years[i] != year:
+        raise KeyError(year)
+    return i
+
+def feature_index(cube,feature):
+    '''
+        Outputs the position of feature along the third axis of the cube.
+    '''
+    matches = np.flatnonzero(cube.features == feature)
+    if len(matches) == 0:
+        raise KeyError(feature)
+    return matches[0]
+
+def cube_year_feature(cube,year,feature):
+    '''
+        Outputs a tuple (coords,values) for the stations reporting feature in year,
+        with coords an array of shape (n,2) of (latitude,longitude) pairs and values the corresponding array of length n.
+    '''
+    i = year_index(cube,year)
+    j = feature_index(cube,feature)
+    present = cube.mask[i,:,j]
+    return (cube.coords[present],np.asarray(cube.values[i,present,j]))
+
+def cube_year_df(cube,year):
+    '''
+        Outputs the rows for year as a dataframe in the layout of the long climate dataframe (DATE, LATITUDE, LONGITUDE, NAME and the features),
+        containing a row for every station present in that year, including those whose features are all NaN.
+    '''
+    i = year_index(cube,year)
+    present = np.asarray(cube.present[i])
+
+    df = pd.DataFrame(np.asarray(cube.values[i,present]),columns=list(cube.features))
+    df.insert(0,'NAME',cube.stations[present])
+    df.insert(0,'LONGITUDE',cube.coords[present,1])
+    df.insert(0,'LATITUDE',cube.coords[present,0])
+    df.insert(0,'DATE',year)
+    return df
+
+def cube_data_per_year_count(cube):
+    '''
+        The cube analogue of data_per_year_count.
+        Outputs a list of tuple pairs of integers. In each tuple, the first entry is the year, and the second the number of stations present in that year.
+        Sorts the output list by the second value in each tuple.
+    '''
+    counts = cube.present.sum(axis=1)
+    data_per_year = [(int(year),int(count)) for year,count in zip(cube.years,counts)]
+    data_per_year = sorted(data_per_year, key = lambda x: x[1])
+
+    return data_per_year
+
+def cube_missing_counts(cube):
+    '''
+        Outputs a dataframe indexed by year, with one column per feature, giving the number of stations present in that year which are missing that feature.
+    '''
+    present = cube.present.sum(axis=1)
+    observed = cube.mask.sum(axis=1)
+    return pd.DataFrame(present[:,None] - observed,index=cube.years,columns=list(cube.features))
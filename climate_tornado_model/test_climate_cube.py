@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from climate_cube import build_climate_cube, load_climate_cube, cube_year_df, cube_year_feature, cube_data_per_year_count, cube_missing_counts
+from data_interpolation import data_per_year_count
+
+features = ['TAVG','PRCP']
+
+def small_climate_df():
+    '''
+        A small frame in the layout of yearly_climate_data.csv. Station B's 1950 row and the only 1952 row have all features missing.
+    '''
+    return pd.DataFrame({
+        'DATE':[1950,1950,1951,1951,1952],
+        'LATITUDE':[35.0,36.5,35.0,36.5,35.0],
+        'LONGITUDE':[-97.0,-95.5,-97.0,-95.5,-97.0],
+        'ELEVATION':[300.0,250.0,300.0,250.0,300.0],
+        'NAME':['A, OK US','B, KS US','A, OK US','B, KS US','A, OK US'],
+        'TAVG':[15.0,np.nan,16.0,14.0,np.nan],
+        'PRCP':[800.0,np.nan,np.nan,700.0,np.nan]})
+
+def test_cube_year_df_round_trip(tmp_path):
+    data = small_climate_df()
+    cube = build_climate_cube(data,features,tmp_path)
+
+    for year in data['DATE'].unique():
+        expected = data[data.DATE == year][['DATE','LATITUDE','LONGITUDE','NAME'] + features]
+        expected = expected.sort_values('NAME').reset_index(drop=True)
+        result = cube_year_df(cube,year).sort_values('NAME').reset_index(drop=True)
+        pd.testing.assert_frame_equal(result,expected,check_dtype=False)
+
+def test_counts_match_long_frame(tmp_path):
+    data = small_climate_df()
+    cube = build_climate_cube(data,features,tmp_path)
+
+    assert cube_data_per_year_count(cube) == [(int(year),count) for year,count in data_per_year_count(data)]
+
+    missing = cube_missing_counts(cube)
+    for year in data['DATE'].unique():
+        year_df = data[data.DATE == year]
+        for feature in features:
+            assert missing.loc[year,feature] == year_df[feature].isna().sum()
+
+def test_year_feature_slice(tmp_path):
+    cube = build_climate_cube(small_climate_df(),features,tmp_path)
+
+    coords, values = cube_year_feature(cube,1951,'PRCP')
+    np.testing.assert_array_equal(coords,[[36.5,-95.5]])
+    np.testing.assert_array_equal(values,[700.0])
+
+def test_load_is_read_only(tmp_path):
+    build_climate_cube(small_climate_df(),features,tmp_path)
+    cube = load_climate_cube(tmp_path)
+
+    assert isinstance(cube.values,np.memmap)
+    with pytest.raises(ValueError):
+        cube.values[0,0,0] = 0.0
+
+def test_duplicate_rows_raise(tmp_path):
+    data = small_climate_df()
+    data = pd.concat([data,data.iloc[[0]]])
+
+    with pytest.raises(ValueError):
+        build_climate_cube(data,features,tmp_path / 'cube')
+    assert not (tmp_path / 'cube').exists()
+
+def test_missing_coordinates_raise(tmp_path):
+    data = small_climate_df()
+    data.loc[1,'LATITUDE'] = np.nan
+
+    with pytest.raises(ValueError):
+        build_climate_cube(data,features,tmp_path / 'cube')
+    assert not (tmp_path / 'cube').exists()
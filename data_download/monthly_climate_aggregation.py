@@ -0,0 +1,109 @@
+import pandas as pd
+import numpy as np
+import os
+import tarfile
+
+from io import BytesIO
+
+# The months making up tornado season, and the monthly features to aggregate over them. Means are taken of the monthly averages and totals,
+# while the monthly extremes are reduced to the extreme over the whole season. An aggregate is only kept if its feature was reported in at least
+# min_season_months of the season months, so that sparse reporters do not produce skewed seasonal values.
+
+season_months = [3,4,5,6]
+season_label = 'MAMJ'
+
+mean_features = ['TAVG','TMAX','TMIN','PRCP','DP01','DP10','DT32','DX90','HTDD','CLDD']
+max_features = ['EMXT','EMXP']
+min_features = ['EMNT']
+
+id_columns = ['STATION','DATE','LATITUDE','LONGITUDE','ELEVATION','NAME']
+states_to_remove = ['VI', 'MP', 'AK','HI','PR','AS', 'GU']
+
+min_season_months = 3
+
+def seasonal_station_aggregates(df):
+    '''
+        Given the monthly GSOM data for a single station, restricts it to the months of tornado season and the years 1950 through 2024,
+        and outputs a dataframe with one row per year containing the season mean of each feature in mean_features,
+        the season maximum of each feature in max_features, and the season minimum of each feature in min_features.
+        Any aggregate whose feature was reported in fewer than min_season_months months of that season is set to NaN.
+        The number of season months reported for that year is stored in the column season_label + '_MONTHS'.
+    '''
+    df = df[~df.LATITUDE.isna()]
+    df = df[~df.LONGITUDE.isna()]
+
+    dates = pd.to_datetime(df['DATE'], format='%Y-%m')
+    df = df.assign(DATE = dates.dt.year, MONTH = dates.dt.month)
+    df = df[df['MONTH'].isin(season_months)]
+    df = df.query('DATE >= 1950 and DATE <= 2024')
+
+    missing_features = [feature for feature in mean_features + max_features + min_features if feature not in df.columns]
+    df = df.assign(**{feature: np.nan for feature in missing_features})
+
+    aggregations = {'LATITUDE':'last','LONGITUDE':'last','ELEVATION':'last','NAME':'last','MONTH':'count'}
+    aggregations.update({feature:'mean' for feature in mean_features})
+    aggregations.update({feature:'max' for feature in max_features})
+    aggregations.update({feature:'min' for feature in min_features})
+
+    features = mean_features + max_features + min_features
+    grouped = df.groupby('DATE')
+    result = grouped.agg(aggregations).reset_index()
+    feature_counts = grouped[features].count().reset_index(drop=True)
+    for feature in features:
+        result[feature] = result[feature].where(feature_counts[feature] >= min_season_months)
+
+    result = result[['DATE','LATITUDE','LONGITUDE','ELEVATION','NAME','MONTH'] + features]
+    result = result.rename(columns = {'MONTH':season_label + '_MONTHS'})
+    result = result.rename(columns = {feature: feature + '_' + season_label + '_MEAN' for feature in mean_features})
+    result = result.rename(columns = {feature: feature + '_' + season_label + '_MAX' for feature in max_features})
+    result = result.rename(columns = {feature: feature + '_' + season_label + '_MIN' for feature in min_features})
+    return result
+
+def write_batch(batch_dfs, path, first_batch):
+    '''
+        Concatenates the aggregated station dataframes in batch_dfs and appends them to the csv at path,
+        writing the header only for the first batch.
+    '''
+    if len(batch_dfs) == 0:
+        return first_batch
+
+    batch_df = pd.concat(batch_dfs)
+    batch_df.to_csv(path, mode = 'w' if first_batch else 'a', header = first_batch, index = False)
+    return False
+
+def aggregate_station_archive(archive_path, output_path, batch_size = 500):
+    '''
+        Streams the station files out of the GSOM archive at archive_path without extracting it, and writes their seasonal aggregates to the csv at output_path.
+        Only the continental US stations are kept, only the needed columns are read, one station file at a time is held in memory,
+        and at most batch_size aggregated stations are held in memory before being appended to the output.
+    '''
+    usecols = set(id_columns + mean_features + max_features + min_features)
+
+    file = tarfile.open(archive_path, mode='r|gz')
+
+    batch_dfs = []
+    first_batch = True
+    for member in file:
+        filename = os.path.basename(member.name)
+        if not member.isfile() or filename[0:2] != "US":
+            continue
+
+        new_df = pd.read_csv(BytesIO(file.extractfile(member).read()), usecols = lambda column: column in usecols, low_memory=False)
+        if new_df.shape[0] == 0:
+            continue
+
+        state = str(new_df['NAME'].iloc[0])[-5:-3]
+        if state in states_to_remove:
+            continue
+
+        station_df = seasonal_station_aggregates(new_df)
+        if station_df.shape[0] > 0:
+            batch_dfs.append(station_df)
+
+        if len(batch_dfs) >= batch_size:
+            first_batch = write_batch(batch_dfs, output_path, first_batch)
+            batch_dfs = []
+            print(filename + ' completed')
+
+    first_batch = write_batch(batch_dfs, output_path, first_batch)
+    file.close()
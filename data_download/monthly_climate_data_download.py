@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# This file accesses and downloads the NOAA GSOM monthly climate dataset and reduces it to seasonal (March-June) aggregates for each station and year.
+# The monthly data is roughly 12 times the size of the yearly GSOY data, so rather than loading every station file and concatenating them,
+# station files are read directly out of the archive in batches, aggregated, and appended to the output csv before the next batch is read.
+# The aggregation itself lives in monthly_climate_aggregation.py.
+
+# In[1]:
+
+
+import wget
+
+from monthly_climate_aggregation import aggregate_station_archive
+
+
+# In[2]:
+
+
+wget.download('https://www.ncei.noaa.gov/data/global-summary-of-the-month/archive/gsom-latest.tar.gz')
+
+
+# The output has one row per station and year, with a DATE column holding the year together with LATITUDE, LONGITUDE, ELEVATION and NAME,
+# in the same layout as yearly_climate_data.csv. It can therefore be passed directly to create_all_test_train_splits, or merged with the yearly data
+# on NAME and DATE.
+
+# In[ ]:
+
+
+aggregate_station_archive('gsom-latest.tar.gz', 'monthly_climate_data.csv', batch_size = 500)
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import tarfile
+
+from io import BytesIO
+
+from monthly_climate_aggregation import seasonal_station_aggregates, aggregate_station_archive
+
+def station_df(dates,name='X, OK US',**features):
+    '''
+        A small frame in the layout of a single GSOM station file.
+    '''
+    df = pd.DataFrame({'STATION':'USC00000001','DATE':dates,'LATITUDE':35.0,'LONGITUDE':-97.0,'ELEVATION':300.0,'NAME':name})
+    for feature, values in features.items():
+        df[feature] = values
+    return df
+
+def test_full_season_aggregates():
+    df = station_df(['1950-03','1950-04','1950-05','1950-06'],TAVG=[10.0,12.0,14.0,20.0],EMXT=[20.0,25.0,30.0,35.0],EMNT=[0.0,1.0,2.0,3.0])
+    result = seasonal_station_aggregates(df)
+
+    assert list(result.columns[:6]) == ['DATE','LATITUDE','LONGITUDE','ELEVATION','NAME','MAMJ_MONTHS']
+    assert result.shape[0] == 1
+    row = result.iloc[0]
+    assert row['DATE'] == 1950
+    assert row['MAMJ_MONTHS'] == 4
+    assert row['TAVG_MAMJ_MEAN'] == 14.0
+    assert row['EMXT_MAMJ_MAX'] == 35.0
+    assert row['EMNT_MAMJ_MIN'] == 0.0
+    assert np.isnan(row['PRCP_MAMJ_MEAN'])
+
+def test_sparse_season_is_nan():
+    df = station_df(['1951-05','1952-03','1952-04','1952-05'],TAVG=[15.0,8.0,np.nan,12.0],PRCP=[50.0,60.0,70.0,80.0])
+    result = seasonal_station_aggregates(df).set_index('DATE')
+
+    assert result.loc[1951,'MAMJ_MONTHS'] == 1
+    assert np.isnan(result.loc[1951,'TAVG_MAMJ_MEAN'])
+    assert np.isnan(result.loc[1951,'PRCP_MAMJ_MEAN'])
+    assert np.isnan(result.loc[1952,'TAVG_MAMJ_MEAN'])
+    assert result.loc[1952,'PRCP_MAMJ_MEAN'] == 70.0
+
+def test_months_outside_season_ignored():
+    df = station_df(['1960-01','1960-03','1960-04','1960-05','1960-07','1960-12'],TAVG=[-5.0,10.0,12.0,14.0,30.0,-10.0])
+    result = seasonal_station_aggregates(df)
+
+    assert result.shape[0] == 1
+    assert result.iloc[0]['MAMJ_MONTHS'] == 3
+    assert result.iloc[0]['TAVG_MAMJ_MEAN'] == 12.0
+
+def test_out_of_range_years_dropped():
+    dates = [str(year) + '-0' + str(month) for year in [1949,2000,2025] for month in [3,4,5]]
+    df = station_df(dates,TAVG=[10.0]*9)
+    result = seasonal_station_aggregates(df)
+
+    assert list(result['DATE']) == [2000]
+
+def add_station_file(archive,filename,df):
+    contents = df.to_csv(index=False).encode()
+    info = tarfile.TarInfo(filename)
+    info.size = len(contents)
+    archive.addfile(info,BytesIO(contents))
+
+def test_aggregate_station_archive(tmp_path):
+    season = ['1970-03','1970-04','1970-05','1970-06']
+    archive_path = tmp_path / 'gsom.tar.gz'
+    with tarfile.open(archive_path,mode='w:gz') as archive:
+        add_station_file(archive,'USC00000001.csv',station_df(season,name='A, OK US',TAVG=[10.0,12.0,14.0,20.0]))
+        add_station_file(archive,'USC00000002.csv',station_df(season,name='B, AK US',TAVG=[0.0,1.0,2.0,3.0]))
+        add_station_file(archive,'CA000000003.csv',station_df(season,name='C, ON CA',TAVG=[5.0,6.0,7.0,8.0]))
+        add_station_file(archive,'USC00000004.csv',station_df(season,name='D, KS US',TAVG=[11.0,13.0,15.0,21.0]))
+
+    output_path = tmp_path / 'monthly_climate_data.csv'
+    aggregate_station_archive(archive_path,output_path,batch_size=1)
+
+    result = pd.read_csv(output_path)
+    assert list(result['NAME']) == ['A, OK US','D, KS US']
+    assert list(result['TAVG_MAMJ_MEAN']) == [14.0,15.0]